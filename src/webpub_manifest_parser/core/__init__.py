@@ -8,6 +8,13 @@ import requests
 
 from webpub_manifest_parser.core.analyzer import AnalyzerContext
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class ManifestParserResult(AnalyzerContext):
     """Class containing the result of the semantic analysis: root AST node and a list of found errors."""
@@ -80,10 +87,16 @@ class ManifestParser:
         :return: Parser result
         :rtype: ManifestParserResult
         """
-        with open(input_file_path, "r", encoding=encoding) as input_file:
-            manifest_json = self.get_manifest_json(input_file)
+        # The JSON decoder performs UTF-8 decoding itself, so UTF-8 files are
+        # read as raw bytes to avoid a separate Python-level decode pass.
+        if encoding.lower() in ("utf-8", "utf8"):
+            with open(input_file_path, "rb") as input_file:
+                manifest_json = self.get_manifest_json(input_file)
+        else:
+            with open(input_file_path, "r", encoding=encoding) as input_file:
+                manifest_json = self.get_manifest_json(input_file)
 
-            return self._parse(manifest_json)
+        return self._parse(manifest_json)
 
     def parse_stream(self, input_stream):
         """Parse the input file and return the result: root AST object and a list of errors.
@@ -120,9 +133,18 @@ class ManifestParser:
         :rtype: ManifestParserResult
         """
         response = requests.get(url, params=params, auth=auth, proxies=proxies)
-        input_stream = StringIO(str(response.content, encoding))
+
+        if encoding.lower() in ("utf-8", "utf8"):
+            input_stream = io.BytesIO(response.content)
+        else:
+            input_stream = StringIO(str(response.content, encoding))
+
         manifest_json = self.get_manifest_json(input_stream)
 
+        # Release the response and its buffered copy of the document before
+        # parsing so that they do not stay resident during AST construction.
+        del response, input_stream
+
         return self._parse(manifest_json)
 
     def parse_json(self, manifest_json):
@@ -140,7 +162,9 @@ class ManifestParser:
     def get_manifest_json(input_stream):
         """Parse the input stream into a JSON document containing an RWPM-compatible manifest.
 
-        :param input_stream: Input stream containing JSON document with an RWPM-compatible manifest
+        :param input_stream: Input stream containing JSON document with an RWPM-compatible manifest.
+            Binary streams must contain UTF-8 (or, with the stdlib decoder, UTF-16/32) encoded JSON;
+            the decoding is delegated to the JSON decoder
         :type input_stream: Union[io.StringIO, io.BinaryIO]
 
         :return: JSON document containing an RWPM-compatible manifest
@@ -149,8 +173,11 @@ class ManifestParser:
         logging.debug("Started parsing input stream into a JSON document")
 
         input_stream_content = input_stream.read()
-        input_stream_content = input_stream_content.strip()
-        manifest_json = json.loads(input_stream_content)
+        manifest_json = _json_loads(input_stream_content)
+
+        # Drop the raw document as soon as it has been decoded so that its
+        # memory can be reclaimed before the AST is built.
+        del input_stream_content
 
         logging.debug("Finished parsing input stream into a JSON document")
 
@@ -569,19 +569,26 @@ class ArrayParser(ValueParser):
         if not isinstance(value, list):
             raise ValueParserError(value, f"Value '{encode(value)}' must be a list")
 
+        item_parser = self._item_parser
+
+        if not self._unique_items:
+            # The comprehension lets CPython presize the result list,
+            # avoiding repeated reallocations on large arrays.
+            return [item_parser.parse(item) for item in value]
+
         result = []
         seen = set()
 
         for item in value:
-            item = self._item_parser.parse(item)
+            item = item_parser.parse(item)
 
-            if self._unique_items and item in seen:
+            if item in seen:
                 raise ValueParserError(value, f"Item '{encode(item)}' is not unique")
 
             result.append(item)
             seen.add(item)
 
-        return list(result)
+        return result
 
 
 class ObjectParser(ValueParser):
@@ -1,4 +1,5 @@
 import inspect
+import sys
 from abc import ABCMeta, abstractmethod
 
 from webpub_manifest_parser.core.parsers import (
@@ -80,7 +81,10 @@ class Property:
         if not isinstance(parser, ValueParser):
             raise ValueError(f"Argument 'parser' must be an instance of {ValueParser}")
 
-        self._key = key
+        # Property keys are used as dictionary keys on every parse and on every
+        # get_setting_value/set_setting_value call, so intern them to let those
+        # lookups short-circuit on identity instead of comparing characters.
+        self._key = sys.intern(key)
         self._required = required
         self._parser = parser
         self._default_value = default_value
@@ -1,5 +1,6 @@
 import logging
 from abc import abstractmethod
+from functools import lru_cache
 
 from webpub_manifest_parser.core.analyzer import BaseAnalyzer, BaseAnalyzerError
 from webpub_manifest_parser.core.parsers import (
@@ -12,6 +13,82 @@ from webpub_manifest_parser.core.properties import BaseArrayProperty, Properties
 from webpub_manifest_parser.utils import encode, first_or_default, is_string
 
 
+@lru_cache(maxsize=None)
+def _get_extension(cls):
+    """Return the extended version of the specified class, memoized by class.
+
+    :param cls: Class
+    :type cls: Type
+
+    :return: Extended class
+    :rtype: Type
+    """
+    return cls.get_extension()
+
+
+@lru_cache(maxsize=None)
+def _get_class_properties(cls):
+    """Return a tuple of 2-tuples containing information about the class's properties, memoized by class.
+
+    :param cls: Class
+    :type cls: Type
+
+    :return: Tuple of 2-tuples containing the class's properties
+    :rtype: Tuple[Tuple[str, webpub_manifest_parser.core.properties.Property]]
+    """
+    return tuple(PropertiesGrouping.get_class_properties(cls))
+
+
+_TYPE_PARSERS_CACHE = {}
+
+
+def _find_type_parsers(object_property):
+    """Return the type parsers nested in the property's parser, cached per property.
+
+    The result depends only on the property's parser, which never changes after
+    the property is defined, so the parser tree is walked at most once per property.
+
+    :param object_property: Object's property
+    :type object_property: webpub_manifest_parser.core.properties.Property
+
+    :return: List of 3-tuples (parent parser, type parser,
+        boolean value indicating whether the parent parser is an ArrayParser)
+    :rtype: List[Tuple[Optional[ValueParser], TypeParser, bool]]
+    """
+    type_parsers_result = _TYPE_PARSERS_CACHE.get(object_property)
+
+    if type_parsers_result is None:
+        type_parsers_result = [
+            (parent_parser, type_parser, isinstance(parent_parser, ArrayParser))
+            for parent_parser, type_parser in find_parser(
+                object_property.parser, TypeParser
+            )
+        ]
+        _TYPE_PARSERS_CACHE[object_property] = type_parsers_result
+
+    return type_parsers_result
+
+
+@lru_cache(maxsize=None)
+def _get_parse_plan(cls):
+    """Return a precomputed parsing plan for the specified class, memoized by class.
+
+    The plan is a tuple of 3-tuples (property name, property, nested type parsers)
+    so that the per-object parsing loop runs without any reflection or
+    parser-tree traversal.
+
+    :param cls: Class
+    :type cls: Type
+
+    :return: Tuple of 3-tuples (property name, property, nested type parsers)
+    :rtype: Tuple[Tuple[str, webpub_manifest_parser.core.properties.Property, List]]
+    """
+    return tuple(
+        (object_property_name, object_property, _find_type_parsers(object_property))
+        for object_property_name, object_property in _get_class_properties(cls)
+    )
+
+
 class SyntaxAnalyzerError(BaseAnalyzerError):
     """Exception raised in the case of syntax errors."""
 
@@ -60,6 +137,8 @@ class SyntaxAnalyzer(BaseAnalyzer):
         super().__init__()
 
         self._logger = logging.getLogger(__name__)
+        self._debug = self._logger.isEnabledFor(logging.DEBUG)
+        self._manifest_class = None
 
     @abstractmethod
     def _create_manifest(self):
@@ -82,22 +161,26 @@ class SyntaxAnalyzer(BaseAnalyzer):
         :return: Property's value
         :rtype: Any
         """
-        self._logger.debug(f"Started extracting {object_property} property")
+        if self._debug:
+            self._logger.debug(f"Started extracting {object_property} property")
 
         if isinstance(json_content, dict):
             property_value = json_content.get(object_property.key, None)
         else:
             property_value = json_content
 
-        self._logger.debug(
-            "Finished extracting {} property: {}".format(
-                object_property, encode(property_value)
+        if self._debug:
+            self._logger.debug(
+                "Finished extracting {} property: {}".format(
+                    object_property, encode(property_value)
+                )
             )
-        )
 
         return property_value
 
-    def _parse_nested_object(self, property_value, object_property):
+    def _parse_nested_object(
+        self, property_value, object_property, type_parsers_result=None
+    ):
         """Parse nested object(s) (if any) and return the result of parsing.
 
         :param property_value: Raw property's value (probably) containing nested object(s)
@@ -106,50 +189,54 @@ class SyntaxAnalyzer(BaseAnalyzer):
         :param object_property: Object's property
         :type object_property: properties.Property
 
+        :param type_parsers_result: (Optional) Precomputed result of _find_type_parsers for the property
+        :type type_parsers_result: Optional[List]
+
         :return: Nested object's value
         :rtype: Any
         """
         if property_value is None:
             return property_value
 
-        self._logger.debug(f"Started looking for nested property {object_property}")
+        if self._debug:
+            self._logger.debug(f"Started looking for nested property {object_property}")
 
-        type_parsers_result = find_parser(object_property.parser, TypeParser)
+        if type_parsers_result is None:
+            type_parsers_result = _find_type_parsers(object_property)
 
-        self._logger.debug(f"Found the following type parsers: {type_parsers_result}")
+        if self._debug:
+            self._logger.debug(
+                f"Found the following type parsers: {type_parsers_result}"
+            )
 
+        value_is_list = isinstance(property_value, list)
         found = False
 
-        for parent_parser, type_parser in type_parsers_result:
-            if isinstance(parent_parser, ArrayParser) and isinstance(
-                property_value, list
-            ):
-                processed_items = []
-
-                for item in property_value:
-                    processed_item = self._parse_object(item, type_parser.type)
-                    processed_items.append(processed_item)
-
+        for parent_parser, type_parser, parent_is_array in type_parsers_result:
+            if parent_is_array and value_is_list:
                 found = True
-                property_value = processed_items
+                property_value = self._parse_object_batch(
+                    property_value, type_parser.type
+                )
                 break
         else:
-            for parent_parser, type_parser in type_parsers_result:
-                if not isinstance(parent_parser, ArrayParser):
+            for parent_parser, type_parser, parent_is_array in type_parsers_result:
+                if not parent_is_array:
                     found = True
                     property_value = self._parse_object(
                         property_value, type_parser.type
                     )
                     break
 
-        if found:
-            self._logger.debug(
-                "Finished parsing nested property {}: {}".format(
-                    object_property, encode(property_value)
+        if self._debug:
+            if found:
+                self._logger.debug(
+                    "Finished parsing nested property {}: {}".format(
+                        object_property, encode(property_value)
+                    )
                 )
-            )
-        else:
-            self._logger.debug(f"Property {object_property} is not nested")
+            else:
+                self._logger.debug(f"Property {object_property} is not nested")
 
         return property_value
 
@@ -159,19 +246,26 @@ class SyntaxAnalyzer(BaseAnalyzer):
 
         For example, values of list properties have to be a collection of the type specified in the property.
         """
-        if isinstance(object_property, BaseArrayProperty) and not isinstance(
-            property_value, object_property.list_type
+        if not isinstance(object_property, BaseArrayProperty):
+            return property_value
+
+        list_type = object_property.list_type
+
+        # Exact-type match is the common case: the parsers already produce
+        # correctly typed collections, so check it with an identity comparison
+        # before falling back to the slower subclass check.
+        if property_value.__class__ is list_type or isinstance(
+            property_value, list_type
         ):
-            if property_value is not None:
-                property_value = object_property.list_type(
-                    property_value
-                    if isinstance(property_value, list)
-                    else [property_value]
-                )
-            else:
-                property_value = object_property.list_type()
+            return property_value
 
-        return property_value
+        if property_value is None:
+            return list_type()
+
+        if isinstance(property_value, list):
+            return list_type(property_value)
+
+        return list_type([property_value])
 
     def _set_scalar_value(self, json_content, ast_object):
         """Parse a scalar string value and initialize an object's property with it.
@@ -225,24 +319,31 @@ class SyntaxAnalyzer(BaseAnalyzer):
         :param excluded_property_names: Set of property names to exclude from consideration
         :type excluded_property_names: Set
         """
-        ast_object_properties = PropertiesGrouping.get_class_properties(
-            ast_object.__class__
-        )
+        parse_plan = _get_parse_plan(ast_object.__class__)
 
-        for object_property_name, object_property in ast_object_properties:
+        record_errors = self._record_errors
+        get_property_value = self._get_property_value
+        parse_nested_object = self._parse_nested_object
+        set_property_value = self._set_property_value
+
+        for object_property_name, object_property, type_parsers_result in parse_plan:
             if (
                 excluded_property_names
                 and object_property_name in excluded_property_names
             ):
                 continue
 
-            with self._record_errors():
-                property_value = self._get_property_value(json_content, object_property)
-                property_value = self._parse_nested_object(
-                    property_value, object_property
-                )
+            with record_errors():
+                property_value = get_property_value(json_content, object_property)
 
-                self._set_property_value(
+                # Properties without nested type parsers hold scalar values only,
+                # so there is nothing for _parse_nested_object to find.
+                if property_value is not None and type_parsers_result:
+                    property_value = parse_nested_object(
+                        property_value, object_property, type_parsers_result
+                    )
+
+                set_property_value(
                     ast_object, object_property_name, object_property, property_value
                 )
 
@@ -263,11 +364,12 @@ class SyntaxAnalyzer(BaseAnalyzer):
         :param property_value: Value to be set
         :type property_value: Any
         """
-        self._logger.debug(
-            "Property '{}' has the following value: {}".format(
-                object_property.key, encode(property_value)
+        if self._debug:
+            self._logger.debug(
+                "Property '{}' has the following value: {}".format(
+                    object_property.key, encode(property_value)
+                )
             )
-        )
 
         if property_value is None and object_property.default_value is not None:
             property_value = object_property.default_value
@@ -299,21 +401,60 @@ class SyntaxAnalyzer(BaseAnalyzer):
         :return: Node object
         :rtype: Node
         """
-        self._logger.debug(f"Started parsing {cls} object")
+        if self._debug:
+            self._logger.debug(f"Started parsing {cls} object")
+
+        extended_cls = _get_extension(cls)
+        ast_object = self._parse_object_instance(json_content, extended_cls())
 
-        extended_cls = cls.get_extension()
-        ast_object = extended_cls()
+        if self._debug:
+            self._logger.debug(f"Finished parsing {cls} object: {ast_object}")
+
+        return ast_object
 
+    def _parse_object_instance(self, json_content, ast_object):
+        """Initialize the AST object's properties from the object's JSON.
+
+        :param json_content: Dictionary containing object's JSON
+        :type json_content: Dict
+
+        :param ast_object: AST object to be initialized
+        :type ast_object: Node
+
+        :return: The initialized AST object
+        :rtype: Node
+        """
         with self._record_errors():
             if is_string(json_content):
                 self._set_scalar_value(json_content, ast_object)
             elif isinstance(json_content, (list, dict)):
                 self._set_non_scalar_value(json_content, ast_object)
 
-        self._logger.debug(f"Finished parsing {cls} object: {ast_object}")
-
         return ast_object
 
+    def _parse_object_batch(self, items, cls):
+        """Parse a homogeneous array of RWPM's objects' JSON into AST objects.
+
+        Unlike calling _parse_object once per item, the class metadata is
+        resolved once for the whole array.
+
+        :param items: Array of dictionaries containing objects' JSON
+        :type items: List
+
+        :param cls: Class of the objects
+        :type cls: Type
+
+        :return: List of Node objects
+        :rtype: List[Node]
+        """
+        if self._debug:
+            return [self._parse_object(item, cls) for item in items]
+
+        extended_cls = _get_extension(cls)
+        parse_object_instance = self._parse_object_instance
+
+        return [parse_object_instance(item, extended_cls()) for item in items]
+
     def analyze(self, manifest_json):
         """Parse JSON file into RWPM AST.
 
@@ -323,13 +464,19 @@ class SyntaxAnalyzer(BaseAnalyzer):
         :return: RWPM AST
         :rtype: ManifestLike
         """
-        self._logger.debug(f"Started analyzing {manifest_json}")
+        self._debug = self._logger.isEnabledFor(logging.DEBUG)
+
+        if self._debug:
+            self._logger.debug(f"Started analyzing {manifest_json}")
 
         self.context.reset()
 
-        manifest = self._create_manifest()
-        manifest = self._parse_object(manifest_json, manifest.__class__)
+        if self._manifest_class is None:
+            self._manifest_class = self._create_manifest().__class__
+
+        manifest = self._parse_object(manifest_json, self._manifest_class)
 
-        self._logger.debug(f"Finished analyzing {manifest_json}: {manifest}")
+        if self._debug:
+            self._logger.debug(f"Finished analyzing {manifest_json}: {manifest}")
 
         return manifest
@@ -175,7 +175,7 @@ class ODLSemanticAnalyzer(SemanticAnalyzer):
         :param node: Feed's metadata
         :type node: OPDS2FeedMetadata
         """
-        # super(ODLSemanticAnalyzer, self).visit(node)
+        # super().visit(node)
 
     @dispatch(Metadata)
     def visit(self, node):
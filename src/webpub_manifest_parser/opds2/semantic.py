@@ -183,7 +183,7 @@ class OPDS2SemanticAnalyzer(SemanticAnalyzer):
 
         # FIXME: It seems that group definition relaxes requirements for having metadata
         # It means we have to override default behaviour
-        # super(OPDS2SemanticAnalyzer, self).visit(node)
+        # super().visit(node)
 
         if node.metadata:
             with self._record_errors():
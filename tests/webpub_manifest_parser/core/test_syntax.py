@@ -1,4 +1,5 @@
 import datetime
+import logging
 
 from dateutil.tz import tzutc
 from parameterized import parameterized
@@ -155,3 +156,39 @@ class TestSyntaxAnalyzerTest(AnalyzerTest):
         self.check_analyzer_errors(
             analyzer.context.errors, expected_errors, SyntaxAnalyzerError
         )
+
+    def test_analyze_with_debug_logging_enabled(self):
+        """Ensure that the parse result does not depend on the logging level.
+
+        The analyzer takes different code paths depending on whether DEBUG
+        logging is enabled (for example, _parse_object_batch falls back to
+        per-item parsing), so both paths have to produce the same AST.
+        """
+        # Arrange
+        raw_manifest = {
+            "metadata": {"title": "Title", "modified": "2021-01-01T00:00:00Z"},
+            "links": [
+                {"href": "https://example.com/manifest.json", "rel": "self"},
+                {"href": "https://example.com/publication.epub", "rel": "alternate"},
+            ],
+        }
+        logger = logging.getLogger("webpub_manifest_parser.core.syntax")
+        original_level = logger.level
+
+        # Act
+        analyzer = SyntaxAnalyzerTest()
+        manifest_ast = analyzer.analyze(raw_manifest)
+
+        logger.setLevel(logging.DEBUG)
+
+        try:
+            debug_analyzer = SyntaxAnalyzerTest()
+            debug_manifest_ast = debug_analyzer.analyze(raw_manifest)
+        finally:
+            logger.setLevel(original_level)
+
+        # Assert
+        self.assertEqual(manifest_ast, debug_manifest_ast)
+        self.assertEqual(
+            len(analyzer.context.errors), len(debug_analyzer.context.errors)
+        )
@@ -1,6 +1,7 @@
 import datetime
 import os
 from unittest import TestCase
+from unittest.mock import MagicMock, patch
 
 from dateutil.tz import tzutc
 
@@ -143,3 +144,56 @@ class RWPMManifestParserTest(TestCase):
         self.assertEqual(
             RWPMMediaTypesRegistry.HTML.key, resources_sub_collection.links[4].type
         )
+
+
+class RWPMManifestParserParseURLTest(TestCase):
+    @staticmethod
+    def _read_manifest_bytes():
+        input_file_path = os.path.join(
+            os.path.dirname(__file__), "../../files/rwpm/spec_example.json"
+        )
+
+        with open(input_file_path, "rb") as input_file:
+            return input_file.read()
+
+    def test_parse_url_with_utf_8_response(self):
+        """Ensure that parse_url passes UTF-8 response bytes directly to the JSON decoder."""
+        # Arrange
+        parser_factory = RWPMManifestParserFactory()
+        parser = parser_factory.create()
+        response = MagicMock()
+        response.content = self._read_manifest_bytes()
+
+        # Act
+        with patch(
+            "webpub_manifest_parser.core.requests.get", return_value=response
+        ) as requests_get_mock:
+            result = parser.parse_url("https://example.com/manifest.json")
+
+        # Assert
+        requests_get_mock.assert_called_once()
+        self.assertIsInstance(result, ManifestParserResult)
+        self.assertEqual(0, len(result.errors))
+        self.assertIsInstance(result.root, RWPMManifest)
+        self.assertEqual("Moby-Dick", result.root.metadata.title)
+
+    def test_parse_url_with_non_utf_8_response(self):
+        """Ensure that parse_url decodes non-UTF-8 responses before parsing them."""
+        # Arrange
+        parser_factory = RWPMManifestParserFactory()
+        parser = parser_factory.create()
+        response = MagicMock()
+        response.content = self._read_manifest_bytes().decode("utf-8").encode("utf-16")
+
+        # Act
+        with patch(
+            "webpub_manifest_parser.core.requests.get", return_value=response
+        ) as requests_get_mock:
+            result = parser.parse_url("https://example.com/manifest.json", "utf-16")
+
+        # Assert
+        requests_get_mock.assert_called_once()
+        self.assertIsInstance(result, ManifestParserResult)
+        self.assertEqual(0, len(result.errors))
+        self.assertIsInstance(result.root, RWPMManifest)
+        self.assertEqual("Moby-Dick", result.root.metadata.title)